@@ -3,11 +3,30 @@ Base ATS adapter interface.
 Defines the contract that all ATS adapters must implement.
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
 
 from ..models import Job, CandidateCreate, CandidateResponse, Application
 
 
+def split_name(full_name: str) -> Tuple[str, str]:
+    """
+    Split a full name into (first_name, last_name) in a single pass.
+
+    Shared by adapters whose ATS requires separate name fields; strips
+    and splits the string once instead of per-field.
+
+    Args:
+        full_name: The candidate's full name
+
+    Returns:
+        Tuple of (first_name, last_name); last_name is "" for single names
+    """
+    parts = full_name.strip().split(maxsplit=1)
+    if not parts:
+        return full_name, ""
+    return parts[0], parts[1] if len(parts) > 1 else ""
+
+
 class BaseATSAdapter(ABC):
     """
     Abstract base class for ATS adapters.
@@ -16,7 +35,9 @@ class BaseATSAdapter(ABC):
     the required methods. This ensures a consistent interface regardless
     of the underlying ATS provider.
     """
-    
+
+    __slots__ = ()
+
     @abstractmethod
     def get_jobs(self, status_filter: str = None) -> List[Job]:
         """
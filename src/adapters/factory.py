@@ -2,6 +2,7 @@
 ATS Adapter Factory.
 Returns the appropriate adapter based on configuration.
 """
+from functools import lru_cache
 from typing import Type
 
 from .base import BaseATSAdapter
@@ -23,33 +24,50 @@ ADAPTER_REGISTRY: dict[str, Type[BaseATSAdapter]] = {
 }
 
 
+@lru_cache(maxsize=8)
+def _build_adapter(provider: str) -> BaseATSAdapter:
+    """
+    Build and cache an adapter instance for a provider.
+
+    Caching keeps one adapter (and its HTTP client with a live
+    connection pool) per provider for the lifetime of the process -
+    on a warm Lambda container this avoids rebuilding the session on
+    every invocation. Adapters are safe to share: their only mutable
+    state is the session, which is thread-safe under the GIL.
+    """
+    logger.info(f"Creating adapter for provider: {provider}")
+
+    # Registry keys are always lowercase (register_adapter enforces this),
+    # so one .get is the only lookup needed
+    adapter_class = ADAPTER_REGISTRY.get(provider)
+    if adapter_class is None:
+        supported = ", ".join(ADAPTER_REGISTRY.keys())
+        raise ValueError(
+            f"Unsupported ATS provider: {provider}. "
+            f"Supported providers: {supported}"
+        )
+
+    return adapter_class()
+
+
 def get_adapter() -> BaseATSAdapter:
     """
     Get the configured ATS adapter instance.
-    
+
     Reads the ATS_PROVIDER environment variable and returns
     the corresponding adapter.
-    
+
     Returns:
         Configured ATS adapter instance
-        
+
     Raises:
         ValueError: If the configured provider is not supported
     """
-    config = get_config()
-    provider = config.ats_provider.lower()
-    
-    logger.info(f"Creating adapter for provider: {provider}")
-    
-    if provider not in ADAPTER_REGISTRY:
-        supported = ", ".join(ADAPTER_REGISTRY.keys())
-        raise ValueError(
-            f"Unsupported ATS provider: {provider}. "
-            f"Supported providers: {supported}"
-        )
-    
-    adapter_class = ADAPTER_REGISTRY[provider]
-    return adapter_class()
+    return _build_adapter(get_config().ats_provider.lower())
+
+
+# Allow tests (and register_adapter) to drop cached instances
+get_adapter.cache_clear = _build_adapter.cache_clear
 
 
 def register_adapter(name: str, adapter_class: Type[BaseATSAdapter]) -> None:
@@ -60,10 +78,12 @@ def register_adapter(name: str, adapter_class: Type[BaseATSAdapter]) -> None:
     without modifying the core code.
     
     Args:
-        name: Provider name (lowercase)
+        name: Provider name (stored lowercase)
         adapter_class: Adapter class that extends BaseATSAdapter
     """
     ADAPTER_REGISTRY[name.lower()] = adapter_class
+    # Drop any cached instance built from a previously registered class
+    _build_adapter.cache_clear()
     logger.info(f"Registered adapter: {name}")
 
 
@@ -2,10 +2,19 @@
 Greenhouse ATS adapter implementation.
 Maps Greenhouse API to the unified data models.
 """
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
-from .base import BaseATSAdapter
-from ..models import Job, CandidateCreate, CandidateResponse, Application
+from .base import BaseATSAdapter, split_name
+from ..models import (
+    Job,
+    JobStatus,
+    CandidateCreate,
+    CandidateResponse,
+    Application,
+    ApplicationStatus,
+)
 from ..client import HTTPClient, PaginationHandler
 from ..utils.config import get_config
 from ..utils.errors import ATSNotFoundError, ATSError
@@ -21,45 +30,59 @@ class GreenhouseAdapter(BaseATSAdapter):
     
     Greenhouse API Documentation: https://developers.greenhouse.io/harvest.html
     """
+
+    __slots__ = ("client", "paginator")
     
-    # Status mapping from Greenhouse to unified format
+    # Status mapping from Greenhouse to unified format. Values are enum
+    # members because _normalize_job uses model_construct, which skips the
+    # coercion pydantic would otherwise apply.
     JOB_STATUS_MAP = {
-        "open": "OPEN",
-        "closed": "CLOSED",
-        "draft": "DRAFT",
+        "open": JobStatus.OPEN,
+        "closed": JobStatus.CLOSED,
+        "draft": JobStatus.DRAFT,
     }
-    
+
     # Application status mapping
     # Greenhouse uses stages, we map common stage names to our unified statuses
     APPLICATION_STATUS_MAP = {
         # Initial stages
-        "application review": "APPLIED",
-        "applied": "APPLIED",
-        "new": "APPLIED",
-        
+        "application review": ApplicationStatus.APPLIED,
+        "applied": ApplicationStatus.APPLIED,
+        "new": ApplicationStatus.APPLIED,
+
         # Screening stages
-        "phone screen": "SCREENING",
-        "screening": "SCREENING",
-        "recruiter screen": "SCREENING",
-        "phone interview": "SCREENING",
-        "technical screen": "SCREENING",
-        
+        "phone screen": ApplicationStatus.SCREENING,
+        "screening": ApplicationStatus.SCREENING,
+        "recruiter screen": ApplicationStatus.SCREENING,
+        "phone interview": ApplicationStatus.SCREENING,
+        "technical screen": ApplicationStatus.SCREENING,
+
         # Interview stages (also mapped to SCREENING in our simplified model)
-        "interview": "SCREENING",
-        "onsite": "SCREENING",
-        "onsite interview": "SCREENING",
-        "final interview": "SCREENING",
-        
+        "interview": ApplicationStatus.SCREENING,
+        "onsite": ApplicationStatus.SCREENING,
+        "onsite interview": ApplicationStatus.SCREENING,
+        "final interview": ApplicationStatus.SCREENING,
+
         # Offer stages (mapped to SCREENING before acceptance)
-        "offer": "SCREENING",
-        "reference check": "SCREENING",
-        "background check": "SCREENING",
-        
+        "offer": ApplicationStatus.SCREENING,
+        "reference check": ApplicationStatus.SCREENING,
+        "background check": ApplicationStatus.SCREENING,
+
         # Final statuses
-        "hired": "HIRED",
-        "rejected": "REJECTED",
+        "hired": ApplicationStatus.HIRED,
+        "rejected": ApplicationStatus.REJECTED,
     }
-    
+
+    # Substring fallback for stage names that don't match exactly, compiled
+    # once at class load. Longest patterns first so e.g. "phone screen" wins
+    # over "screen" if both ever appear.
+    _STAGE_PATTERN = re.compile(
+        "|".join(
+            re.escape(stage)
+            for stage in sorted(APPLICATION_STATUS_MAP, key=len, reverse=True)
+        )
+    )
+
     def __init__(self):
         """Initialize Greenhouse adapter with configuration."""
         config = get_config()
@@ -85,20 +108,24 @@ class GreenhouseAdapter(BaseATSAdapter):
         if status_filter:
             params["status"] = status_filter.lower()
         
-        raw_jobs = self.paginator.paginate(fetch_page, params)
-        
-        jobs = []
-        for raw_job in raw_jobs:
-            try:
-                job = self._normalize_job(raw_job)
-                if job:
-                    jobs.append(job)
-            except Exception as e:
-                logger.warning(f"Failed to normalize job {raw_job.get('id')}: {e}")
-                continue
-        
+        # Normalize records as pages arrive instead of materializing the
+        # full raw list first
+        jobs = [
+            job
+            for raw_job in self.paginator.iter_items(fetch_page, params)
+            if (job := self._normalize_job_safe(raw_job)) is not None
+        ]
+
         logger.info(f"Fetched and normalized {len(jobs)} jobs")
         return jobs
+
+    def _normalize_job_safe(self, raw_job: Dict[str, Any]) -> Optional[Job]:
+        """Normalize a raw job, logging and skipping records that fail."""
+        try:
+            return self._normalize_job(raw_job)
+        except Exception as e:
+            logger.warning(f"Failed to normalize job {raw_job.get('id')}: {e}")
+            return None
     
     def _normalize_job(self, raw_job: Dict[str, Any]) -> Optional[Job]:
         """Convert Greenhouse job to unified Job model."""
@@ -109,14 +136,16 @@ class GreenhouseAdapter(BaseATSAdapter):
         
         # Map status
         raw_status = raw_job.get("status", "draft").lower()
-        status = self.JOB_STATUS_MAP.get(raw_status, "DRAFT")
+        status = self.JOB_STATUS_MAP.get(raw_status, JobStatus.DRAFT)
         
         # Get external URL
         external_url = self._get_job_url(raw_job)
-        
-        return Job(
+
+        # Every field is sanitized to a valid value above, so skip pydantic
+        # validation for the hot bulk-normalization path
+        return Job.model_construct(
             id=job_id,
-            title=raw_job.get("name", "Untitled Position"),
+            title=raw_job.get("name") or "Untitled Position",
             location=location,
             status=status,
             external_url=external_url
@@ -124,19 +153,20 @@ class GreenhouseAdapter(BaseATSAdapter):
     
     def _extract_location(self, raw_job: Dict[str, Any]) -> str:
         """Extract location string from Greenhouse job data."""
-        offices = raw_job.get("offices", [])
+        offices = raw_job.get("offices")
         if offices:
-            office_names = [o.get("name", "") for o in offices if o.get("name")]
-            if office_names:
-                return ", ".join(office_names)
-        
+            # Single .get per office, no intermediate list
+            joined = ", ".join(filter(None, (o.get("name") for o in offices)))
+            if joined:
+                return joined
+
         # Fallback to location field if present
-        location = raw_job.get("location", {})
+        location = raw_job.get("location")
         if isinstance(location, dict):
             return location.get("name", "Remote")
         elif isinstance(location, str):
             return location
-        
+
         return "Remote"
     
     def _get_job_url(self, raw_job: Dict[str, Any]) -> str:
@@ -150,20 +180,54 @@ class GreenhouseAdapter(BaseATSAdapter):
         job_id = raw_job.get("id", "")
         return f"https://boards.greenhouse.io/jobs/{job_id}"
     
+    # Bounded so bulk ingest stays inside Greenhouse rate limits
+    _BULK_CREATE_CONCURRENCY = 8
+
     def create_candidate(self, candidate: CandidateCreate) -> CandidateResponse:
         """
         Create a candidate in Greenhouse and add to job.
-        
+
         Greenhouse requires:
         1. POST /candidates - Create candidate
         2. POST /candidates/{id}/applications - Add to job (creates application)
         """
         logger.info(f"Creating candidate: {candidate.email}")
-        
-        # Prepare candidate payload
+
+        # Create candidate
+        response, _ = self.client.post("candidates", self._build_candidate_payload(candidate))
+
+        return self._candidate_response(candidate, response)
+
+    def create_candidates(self, candidates: List[CandidateCreate]) -> List[CandidateResponse]:
+        """
+        Create multiple candidates concurrently for bulk ingest workloads.
+
+        Issues the per-candidate POSTs on a bounded thread pool over the
+        shared keep-alive connection pool, so N candidates cost roughly
+        max(RTT) instead of N serial round-trips. Results are returned in
+        input order.
+
+        Args:
+            candidates: Candidate creation payloads, each with a job_id
+
+        Returns:
+            List of CandidateResponse objects, one per input candidate
+        """
+        if not candidates:
+            return []
+
+        logger.info(f"Creating {len(candidates)} candidates")
+
+        workers = min(self._BULK_CREATE_CONCURRENCY, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.create_candidate, candidates))
+
+    def _build_candidate_payload(self, candidate: CandidateCreate) -> Dict[str, Any]:
+        """Build the Greenhouse candidate-create payload."""
+        first_name, last_name = split_name(candidate.name)
         candidate_payload = {
-            "first_name": self._extract_first_name(candidate.name),
-            "last_name": self._extract_last_name(candidate.name),
+            "first_name": first_name,
+            "last_name": last_name,
             "email_addresses": [
                 {"value": candidate.email, "type": "personal"}
             ],
@@ -189,22 +253,27 @@ class GreenhouseAdapter(BaseATSAdapter):
                     "url": candidate.resume_url
                 }
             ]
-        
-        # Create candidate
-        response, _ = self.client.post("candidates", candidate_payload)
-        
+
+        return candidate_payload
+
+    def _candidate_response(
+        self,
+        candidate: CandidateCreate,
+        response: Dict[str, Any]
+    ) -> CandidateResponse:
+        """Build a CandidateResponse from a Greenhouse create response."""
         candidate_id = str(response.get("id", ""))
-        
+
         # Get application ID from response
         applications = response.get("applications", [])
         application_id = str(applications[0]["id"]) if applications else ""
-        
+
         if not application_id:
             raise ATSError(
                 message="Failed to create application for candidate",
                 status_code=500
             )
-        
+
         return CandidateResponse(
             candidate_id=candidate_id,
             application_id=application_id,
@@ -216,13 +285,11 @@ class GreenhouseAdapter(BaseATSAdapter):
     
     def _extract_first_name(self, full_name: str) -> str:
         """Extract first name from full name."""
-        parts = full_name.strip().split()
-        return parts[0] if parts else full_name
-    
+        return split_name(full_name)[0]
+
     def _extract_last_name(self, full_name: str) -> str:
         """Extract last name from full name."""
-        parts = full_name.strip().split()
-        return " ".join(parts[1:]) if len(parts) > 1 else ""
+        return split_name(full_name)[1]
     
     def get_applications(self, job_id: str) -> List[Application]:
         """
@@ -241,20 +308,22 @@ class GreenhouseAdapter(BaseATSAdapter):
             "per_page": 100
         }
         
-        raw_applications = self.paginator.paginate(fetch_page, params)
-        
-        applications = []
-        for raw_app in raw_applications:
-            try:
-                app = self._normalize_application(raw_app)
-                if app:
-                    applications.append(app)
-            except Exception as e:
-                logger.warning(f"Failed to normalize application {raw_app.get('id')}: {e}")
-                continue
-        
+        applications = [
+            app
+            for raw_app in self.paginator.iter_items(fetch_page, params)
+            if (app := self._normalize_application_safe(raw_app)) is not None
+        ]
+
         logger.info(f"Fetched and normalized {len(applications)} applications")
         return applications
+
+    def _normalize_application_safe(self, raw_app: Dict[str, Any]) -> Optional[Application]:
+        """Normalize a raw application, logging and skipping records that fail."""
+        try:
+            return self._normalize_application(raw_app)
+        except Exception as e:
+            logger.warning(f"Failed to normalize application {raw_app.get('id')}: {e}")
+            return None
     
     def _normalize_application(self, raw_app: Dict[str, Any]) -> Optional[Application]:
         """Convert Greenhouse application to unified Application model."""
@@ -266,12 +335,13 @@ class GreenhouseAdapter(BaseATSAdapter):
         
         # Get email
         emails = candidate.get("email_addresses", [])
-        email = emails[0]["value"] if emails else ""
-        
+        email = (emails[0].get("value") or "") if emails else ""
+
         # Determine status from current stage and rejection
         status = self._determine_application_status(raw_app)
-        
-        return Application(
+
+        # As with jobs, all fields are sanitized above - skip re-validation
+        return Application.model_construct(
             id=app_id,
             candidate_name=candidate_name,
             email=email,
@@ -284,7 +354,7 @@ class GreenhouseAdapter(BaseATSAdapter):
         last_name = candidate.get("last_name", "")
         return f"{first_name} {last_name}".strip() or "Unknown"
     
-    def _determine_application_status(self, raw_app: Dict[str, Any]) -> str:
+    def _determine_application_status(self, raw_app: Dict[str, Any]) -> ApplicationStatus:
         """
         Determine unified application status from Greenhouse data.
         
@@ -293,7 +363,7 @@ class GreenhouseAdapter(BaseATSAdapter):
         # Check if rejected
         rejected_at = raw_app.get("rejected_at")
         if rejected_at:
-            return "REJECTED"
+            return ApplicationStatus.REJECTED
         
         # Check current stage
         current_stage = raw_app.get("current_stage", {})
@@ -302,15 +372,20 @@ class GreenhouseAdapter(BaseATSAdapter):
         # Check for hired status
         status = raw_app.get("status", "").lower()
         if status == "hired" or "hired" in stage_name:
-            return "HIRED"
-        
-        # Map stage to status
-        for pattern, unified_status in self.APPLICATION_STATUS_MAP.items():
-            if pattern in stage_name:
-                return unified_status
+            return ApplicationStatus.HIRED
         
+        # Map stage to status: exact match first, then one compiled regex
+        # scan instead of a Python-level substring loop per application
+        status = self.APPLICATION_STATUS_MAP.get(stage_name)
+        if status:
+            return status
+
+        match = self._STAGE_PATTERN.search(stage_name)
+        if match:
+            return self.APPLICATION_STATUS_MAP[match.group()]
+
         # Default to APPLIED
-        return "APPLIED"
+        return ApplicationStatus.APPLIED
     
     def health_check(self) -> bool:
         """Check Greenhouse API connectivity."""
@@ -12,7 +12,7 @@ from ..utils.errors import (
     ATSError,
     ValidationError
 )
-from ..client.http_client import HTTPClient
+from ..client.http_client import BearerAuth, HTTPClient
 
 
 logger = get_logger(__name__)
@@ -23,32 +23,48 @@ class WorkableAdapter(BaseATSAdapter):
     Adapter for Workable ATS.
     Uses Bearer Token authentication.
     """
-    
+
+    __slots__ = ("config", "client")
+
+    # Workable job states -> unified job status
+    _STATE_MAP = {
+        "published": "OPEN",
+        "closed": "CLOSED",
+        "archived": "CLOSED",
+        "draft": "DRAFT"
+    }
+
+    # Unified status filter -> Workable job state
+    _FILTER_MAP = {
+        "OPEN": "published",
+        "CLOSED": "closed",
+        "DRAFT": "draft"
+    }
+
+    # Workable candidate stages -> unified application status
+    _STAGE_MAP = {
+        "Applied": "APPLIED",
+        "Screening": "SCREENING",
+        "Interview": "SCREENING",
+        "Offer": "SCREENING",
+        "Hired": "HIRED",
+        "Rejected": "REJECTED"
+    }
+
     def __init__(self):
         self.config = get_config()
         self.client = HTTPClient(
             base_url=self.config.ats_base_url,
-            api_key="", # Not used for Basic Auth
+            api_key="",  # Workable uses Bearer Token, not Basic Auth
+            auth=BearerAuth(self.config.workable_api_key)
         )
-        # Override _get_auth to use Bearer Token
-        self.client._get_auth = lambda: None
-        self.client.session.headers.update({
-            "Authorization": f"Bearer {self.config.workable_api_key}"
-        })
     
     def get_jobs(self, status_filter: str = None) -> List[Job]:
         """Fetch jobs from Workable."""
         # Workable states: published, draft, closed, archived
         params = {}
-        if status_filter:
-            # Map unified status to Workable state
-            state_map = {
-                "OPEN": "published",
-                "CLOSED": "closed",
-                "DRAFT": "draft"
-            }
-            if status_filter in state_map:
-                params["state"] = state_map[status_filter]
+        if status_filter and status_filter in self._FILTER_MAP:
+            params["state"] = self._FILTER_MAP[status_filter]
 
         response_data, _ = self.client.get("jobs", params=params)
         
@@ -95,18 +111,12 @@ class WorkableAdapter(BaseATSAdapter):
     def _normalize_job(self, raw_job: Dict[str, Any]) -> Job:
         """Map Workable job to unified Job model."""
         state = raw_job.get("state", "published")
-        status_map = {
-            "published": "OPEN",
-            "closed": "CLOSED",
-            "archived": "CLOSED",
-            "draft": "DRAFT"
-        }
-        
+
         return Job(
             id=raw_job.get("shortcode"), # shortcode is the unique identifier for jobs in Workable
             title=raw_job.get("title"),
             location=raw_job.get("location", {}).get("city", "Remote"),
-            status=status_map.get(state, "OPEN"),
+            status=self._STATE_MAP.get(state, "OPEN"),
             external_url=raw_job.get("url")
         )
 
@@ -114,21 +124,12 @@ class WorkableAdapter(BaseATSAdapter):
         """Map Workable candidate to unified Application model."""
         # Workable stages: 'Applied', 'Screening', 'Interview', 'Offer', 'Hired', 'Rejected'
         stage = raw_cand.get("stage", "Applied")
-        
-        status_map = {
-            "Applied": "APPLIED",
-            "Screening": "SCREENING",
-            "Interview": "SCREENING",
-            "Offer": "SCREENING",
-            "Hired": "HIRED",
-            "Rejected": "REJECTED"
-        }
-        
+
         return Application(
             id=str(raw_cand.get("id")),
             candidate_name=raw_cand.get("name"),
             email=raw_cand.get("email"),
-            status=status_map.get(stage, "APPLIED")
+            status=self._STAGE_MAP.get(stage, "APPLIED")
         )
 
     def health_check(self) -> bool:
@@ -1,10 +1,11 @@
 """
 Zoho Recruit ATS adapter implementation.
 """
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
-from .base import BaseATSAdapter
+from .base import BaseATSAdapter, split_name
 from ..models import Job, CandidateCreate, CandidateResponse, Application
 from ..utils.config import get_config
 from ..utils.logging import get_logger
@@ -20,124 +21,255 @@ from ..client.http_client import HTTPClient
 logger = get_logger(__name__)
 
 
+# Access tokens cached per client_id so concurrent requests (and adapter
+# re-instantiation) share one OAuth refresh instead of each paying the
+# 200-500ms round-trip to accounts.zoho.*
+_TOKEN_LOCK = threading.Lock()
+_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+
+# Session for the accounts.zoho.* token endpoint, created on first use so
+# the TLS handshake is amortized across refreshes (one per ~50 minutes in
+# a long-lived container)
+_TOKEN_SESSION = None
+
+
+def _token_session():
+    """Get the lazily created session for the OAuth token endpoint."""
+    global _TOKEN_SESSION
+    if _TOKEN_SESSION is None:
+        import requests
+        _TOKEN_SESSION = requests.Session()
+    return _TOKEN_SESSION
+
+
 class ZohoRecruitAdapter(BaseATSAdapter):
     """
     Adapter for Zoho Recruit ATS.
     Handles OAuth 2.0 token refreshing and API mapping.
     """
-    
+
+    __slots__ = ("config", "access_token", "token_expiry", "client")
+
+    # Zoho Job_Opening_Status values -> unified job status
+    _JOB_STATUS_MAP = {
+        "In-progress": "OPEN",
+        "Filled": "CLOSED",
+        "Cancelled": "CLOSED",
+        "Draft": "DRAFT",
+        "On-hold": "DRAFT"
+    }
+
+    # Unified job status -> Zoho Job_Opening_Status values, for pushing
+    # status filters into the server-side query
+    _REVERSE_JOB_STATUS = {
+        "OPEN": ["In-progress"],
+        "CLOSED": ["Filled", "Cancelled"],
+        "DRAFT": ["Draft", "On-hold"]
+    }
+
+    # Zoho Application_Status values -> unified application status
+    _APP_STATUS_MAP = {
+        "Applied": "APPLIED",
+        "Screening": "SCREENING",
+        "Rejected": "REJECTED",
+        "Hired": "HIRED"
+    }
+
     def __init__(self):
         self.config = get_config()
         self.access_token = None
         self.token_expiry = 0
         
-        # Initialize client with empty key, we'll handle headers manually
+        # Initialize client with empty key (so no Basic Auth is applied);
+        # the rotating OAuth token is set as a session header on refresh
         self.client = HTTPClient(
             base_url=self.config.ats_base_url,
             api_key="",
         )
-        # Override _get_auth for Zoho
-        self.client._get_auth = lambda: None
     
     def _refresh_access_token(self):
-        """Fetch a new access token using the refresh token."""
+        """
+        Fetch a new access token using the refresh token.
+
+        Uses double-checked locking around a module-level token cache so
+        that N concurrent callers (or freshly built adapter instances)
+        trigger at most one refresh per client_id.
+        """
         if self.access_token and time.time() < self.token_expiry - 60:
             return
 
-        logger.info("Refreshing Zoho access token")
-        accounts_url = self.config.get_zoho_accounts_url()
-        
-        try:
-            import requests
-            response = requests.post(
-                f"{accounts_url}/oauth/v2/token",
-                data={
-                    "refresh_token": self.config.zoho_refresh_token,
-                    "client_id": self.config.zoho_client_id,
-                    "client_secret": self.config.zoho_client_secret,
-                    "grant_type": "refresh_token"
-                },
-                timeout=10
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Failed to refresh Zoho token: {response.text}")
-                raise ATSAuthenticationError("Failed to refresh Zoho access token")
-            
-            data = response.json()
-            if "access_token" not in data:
-                logger.error(f"Invalid response from Zoho token endpoint: {data}")
-                raise ATSAuthenticationError("Invalid response from Zoho token endpoint")
-            
-            self.access_token = data["access_token"]
-            # Set expiry (usually 3600s, use 3500 to be safe)
-            self.token_expiry = time.time() + data.get("expires_in", 3600)
-            
-            # Update client session headers
-            self.client.session.headers.update({
-                "Authorization": f"Zoho-oauthtoken {self.access_token}"
-            })
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Connection error while refreshing Zoho token: {str(e)}")
-            raise ATSConnectionError(f"Failed to connect to Zoho token service: {str(e)}")
+        client_id = self.config.zoho_client_id
+
+        with _TOKEN_LOCK:
+            # Re-check under the lock: another thread may have refreshed
+            # while we were waiting.
+            token, expiry = _TOKEN_CACHE.get(client_id, (None, 0))
+            if token and time.time() < expiry - 60:
+                self._adopt_token(token, expiry)
+                return
+
+            logger.info("Refreshing Zoho access token")
+            accounts_url = self.config.get_zoho_accounts_url()
+
+            try:
+                import requests
+                response = _token_session().post(
+                    f"{accounts_url}/oauth/v2/token",
+                    data={
+                        "refresh_token": self.config.zoho_refresh_token,
+                        "client_id": client_id,
+                        "client_secret": self.config.zoho_client_secret,
+                        "grant_type": "refresh_token"
+                    },
+                    timeout=10
+                )
+
+                if response.status_code != 200:
+                    logger.error(f"Failed to refresh Zoho token: {response.text}")
+                    raise ATSAuthenticationError("Failed to refresh Zoho access token")
+
+                data = response.json()
+                if "access_token" not in data:
+                    logger.error(f"Invalid response from Zoho token endpoint: {data}")
+                    raise ATSAuthenticationError("Invalid response from Zoho token endpoint")
+
+                # Set expiry (usually 3600s, the 60s margin above keeps us safe)
+                token = data["access_token"]
+                expiry = time.time() + data.get("expires_in", 3600)
+
+                _TOKEN_CACHE[client_id] = (token, expiry)
+                self._adopt_token(token, expiry)
+
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Connection error while refreshing Zoho token: {str(e)}")
+                raise ATSConnectionError(f"Failed to connect to Zoho token service: {str(e)}")
+
+    def _adopt_token(self, token: str, expiry: float):
+        """Apply a cached or freshly fetched token to this instance."""
+        self.access_token = token
+        self.token_expiry = expiry
+        self.client.session.headers.update({
+            "Authorization": f"Zoho-oauthtoken {token}"
+        })
 
     def _ensure_authenticated(self):
         """Ensure we have a valid access token."""
         self._refresh_access_token()
 
     def get_jobs(self, status_filter: str = None) -> List[Job]:
-        """Fetch all Job Openings from Zoho Recruit."""
+        """Fetch Job Openings from Zoho Recruit, filtering server-side."""
         self._ensure_authenticated()
-        
+
+        # Push the status filter into the Zoho query so only matching
+        # records cross the wire, instead of fetching every Job_Opening
+        # and filtering client-side
+        params = None
+        if status_filter in self._REVERSE_JOB_STATUS:
+            zoho_statuses = ",".join(self._REVERSE_JOB_STATUS[status_filter])
+            params = {"criteria": f"(Job_Opening_Status:in:[{zoho_statuses}])"}
+
         # Zoho module name is 'Job_Openings'
-        response_data, _ = self.client.get("Job_Openings")
-        
+        response_data, _ = self.client.get("Job_Openings", params=params)
+
         raw_jobs = response_data.get("data", [])
-        jobs = []
-        
-        for raw_job in raw_jobs:
-            job = self._normalize_job(raw_job)
-            if not status_filter or job.status == status_filter:
-                jobs.append(job)
-        
+        jobs = [self._normalize_job(raw_job) for raw_job in raw_jobs]
+
+        if status_filter and params is None:
+            # Unknown filter value - keep the old client-side behaviour
+            jobs = [job for job in jobs if job.status == status_filter]
+
         return jobs
 
     def create_candidate(self, candidate: CandidateCreate) -> CandidateResponse:
         """Create a candidate in Zoho Recruit and associate with a job."""
         self._ensure_authenticated()
-        
-        # 1. Create Candidate
-        candidate_data = {
+
+        first_name, last_name = split_name(candidate.name)
+        record = {
+            "First_Name": first_name,
+            "Last_Name": last_name or ".",  # Zoho often requires Last Name
+            "Email": candidate.email,
+            "Phone": candidate.phone or "",
+            # Custom fields or resume URL would go here if defined in Zoho
+        }
+
+        # Preferred path: create the candidate and the job association in a
+        # single call via the Applications subform, halving the round-trips
+        # on the common case.
+        combined = {
             "data": [{
-                "First_Name": self._extract_first_name(candidate.name),
-                "Last_Name": self._extract_last_name(candidate.name),
-                "Email": candidate.email,
-                "Phone": candidate.phone or "",
-                # Custom fields or resume URL would go here if defined in Zoho
+                **record,
+                "$append_values": {
+                    "Applications": [{
+                        "Job_Opening_ID": candidate.job_id,
+                        "Application_Status": "Applied"
+                    }]
+                }
             }]
         }
-        
-        cand_resp, _ = self.client.post("Candidates", data=candidate_data)
-        
+
+        try:
+            cand_resp, _ = self.client.post("Candidates", data=combined)
+        except ATSError as e:
+            # Only a payload rejection means the tenant does not support
+            # the subform write; connection/auth/rate-limit failures must
+            # propagate - retrying them via the two-step path would mask
+            # the real error and risks a duplicate create if Zoho already
+            # processed the combined write.
+            if e.status_code != 400:
+                raise
+            cand_resp = None
+
+        if cand_resp and cand_resp.get("data") and cand_resp["data"][0].get("code") == "SUCCESS":
+            candidate_id = cand_resp["data"][0]["details"]["id"]
+            # The application is created as a subform row of the candidate;
+            # Zoho does not return a separate id for it.
+            application_id = candidate_id
+        else:
+            # Tenant does not accept the subform write - fall back to the
+            # two-call create-then-associate path.
+            logger.info("Subform candidate create rejected, falling back to two-step path")
+            candidate_id, application_id = self._create_candidate_two_step(
+                record, candidate.job_id
+            )
+
+        return CandidateResponse(
+            candidate_id=candidate_id,
+            application_id=application_id,
+            name=candidate.name,
+            email=candidate.email,
+            job_id=candidate.job_id,
+            status="APPLIED"
+        )
+
+    def _create_candidate_two_step(self, record: Dict[str, Any], job_id: str) -> Tuple[str, str]:
+        """
+        Create a candidate and its Application record in two calls.
+
+        Returns:
+            Tuple of (candidate_id, application_id)
+        """
+        # 1. Create Candidate
+        cand_resp, _ = self.client.post("Candidates", data={"data": [record]})
+
         if not cand_resp.get("data") or cand_resp["data"][0].get("code") != "SUCCESS":
             error_msg = cand_resp.get("data", [{}])[0].get("message", "Unknown error")
             raise ATSError(f"Failed to create candidate in Zoho: {error_msg}")
-            
+
         candidate_id = cand_resp["data"][0]["details"]["id"]
-        
+
         # 2. Associate with Job (Create Application)
         # In Zoho Recruit, this often means creating a record in the 'Applications' module
         # or updating a subform. Standard practice is the 'Applications' module.
         app_data = {
             "data": [{
                 "Candidate_ID": candidate_id,
-                "Job_Opening_ID": candidate.job_id,
+                "Job_Opening_ID": job_id,
                 "Application_Status": "Applied"
             }]
         }
-        
-        # Module name might be 'Applications' or 'JobOpenings_Candidates' 
+
+        # Module name might be 'Applications' or 'JobOpenings_Candidates'
         # based on Zoho Recruit's specific configuration. Using 'Applications' as default.
         try:
             app_resp, _ = self.client.post("Applications", data=app_data)
@@ -146,14 +278,7 @@ class ZohoRecruitAdapter(BaseATSAdapter):
             logger.warning("Failed to create Application record, candidate created but association might be manual.")
             application_id = "MANUAL_ASSOC_REQUIRED"
 
-        return CandidateResponse(
-            candidate_id=candidate_id,
-            application_id=application_id,
-            name=candidate.name,
-            email=candidate.email,
-            job_id=candidate.job_id,
-            status="APPLIED"
-        )
+        return candidate_id, application_id
 
     def get_applications(self, job_id: str) -> List[Application]:
         """Fetch applications for a job from Zoho Recruit."""
@@ -168,19 +293,11 @@ class ZohoRecruitAdapter(BaseATSAdapter):
 
     def _normalize_job(self, raw_job: Dict[str, Any]) -> Job:
         """Map Zoho Job_Opening record to unified Job model."""
-        status_map = {
-            "In-progress": "OPEN",
-            "Filled": "CLOSED",
-            "Cancelled": "CLOSED",
-            "Draft": "DRAFT",
-            "On-hold": "DRAFT"
-        }
-        
         return Job(
             id=raw_job.get("id"),
             title=raw_job.get("Posting_Title"),
             location=raw_job.get("City", "Remote"),
-            status=status_map.get(raw_job.get("Job_Opening_Status"), "OPEN"),
+            status=self._JOB_STATUS_MAP.get(raw_job.get("Job_Opening_Status"), "OPEN"),
             external_url=f"https://recruit.zoho.{self.config.zoho_region}/recruit/JobOpenings.do?id={raw_job.get('id')}"
         )
 
@@ -188,27 +305,14 @@ class ZohoRecruitAdapter(BaseATSAdapter):
         """Map Zoho Application record to unified Application model."""
         # Note: raw_app often contains partial Candidate info or we might need another fetch
         candidate = raw_app.get("Candidate_ID", {})
-        
-        status_map = {
-            "Applied": "APPLIED",
-            "Screening": "SCREENING",
-            "Rejected": "REJECTED",
-            "Hired": "HIRED"
-        }
-        
+
         return Application(
             id=raw_app.get("id"),
             candidate_name=candidate.get("name") or "Unknown",
             email=candidate.get("email") or "Unknown",
-            status=status_map.get(raw_app.get("Application_Status"), "APPLIED")
+            status=self._APP_STATUS_MAP.get(raw_app.get("Application_Status"), "APPLIED")
         )
 
-    def _extract_first_name(self, name: str) -> str:
-        return name.split(" ", 1)[0] if " " in name else name
-
-    def _extract_last_name(self, name: str) -> str:
-        return name.split(" ", 1)[1] if " " in name else "."  # Zoho often requires Last Name
-
     def health_check(self) -> bool:
         """Check Zoho connection."""
         try:
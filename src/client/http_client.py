@@ -1,14 +1,17 @@
 """
 HTTP client with retry logic, rate limiting, and authentication.
 """
+import threading
 import time
+from collections import OrderedDict
 from typing import Any, Dict, Optional, Tuple
+import orjson
 import requests
-from requests.auth import HTTPBasicAuth
+from requests.auth import AuthBase, HTTPBasicAuth
 from tenacity import (
-    retry,
+    Retrying,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type,
 )
 
@@ -25,9 +28,41 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+# Shared empty-headers sentinel for callers that never read headers
+_EMPTY_HEADERS: Dict[str, str] = {}
+
+
 class RetryableError(Exception):
     """Exception that indicates the request should be retried."""
-    pass
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# Jittered backoff so concurrent workers retrying the same outage spread
+# out instead of hammering the API in lock-step
+_JITTER_WAIT = wait_random_exponential(multiplier=1, max=10)
+
+
+def _retry_wait(retry_state) -> float:
+    """Wait per the server's Retry-After when given, else jittered backoff."""
+    exc = retry_state.outcome.exception()
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        return retry_after
+    return _JITTER_WAIT(retry_state)
+
+
+class BearerAuth(AuthBase):
+    """Bearer-token authentication (used by the Workable adapter)."""
+
+    def __init__(self, token: str):
+        self._header_value = f"Bearer {token}"
+
+    def __call__(self, request):
+        request.headers["Authorization"] = self._header_value
+        return request
 
 
 class HTTPClient:
@@ -35,74 +70,179 @@ class HTTPClient:
     HTTP client for making requests to ATS APIs.
     Includes retry logic, rate limiting, and authentication handling.
     """
-    
+
+    # Bound for the conditional-GET cache; covers the handful of list
+    # endpoints each adapter polls without growing with payload churn
+    _COND_CACHE_MAX = 32
+
+    __slots__ = (
+        "base_url", "api_key", "timeout", "max_retries", "_auth",
+        "session", "_cond_cache", "_cond_lock", "_retrying", "_url_cache"
+    )
+
     def __init__(
         self,
         base_url: str,
         api_key: str,
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        auth: Optional[AuthBase] = None
     ):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            base_url: API base URL
+            api_key: API key for Basic Auth (Greenhouse style); ignored
+                when an explicit auth strategy is provided
+            timeout: Request timeout in seconds
+            max_retries: Maximum retry attempts for retryable failures
+            auth: Optional auth strategy (e.g. BearerAuth) overriding the
+                default Basic Auth behaviour
+        """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
+        if auth is None and api_key:
+            auth = HTTPBasicAuth(api_key, "")
+        self._auth = auth
         self.session = self._create_session()
-    
+        # Session-level auth: requests applies it to every request without
+        # the per-call auth-injection path
+        self.session.auth = self._auth
+        # endpoint -> full URL; each client talks to a handful of fixed
+        # endpoints, so the strip/join work is paid once per endpoint
+        self._url_cache: Dict[str, str] = {}
+        # Built once so every request shares the configured attempt budget
+        self._retrying = Retrying(
+            stop=stop_after_attempt(max(self.max_retries, 1)),
+            wait=_retry_wait,
+            retry=retry_if_exception_type(RetryableError),
+            reraise=True
+        )
+        # Conditional-GET cache: (url, params) -> (etag, last_modified,
+        # parsed_body, headers). On a 304 the cached body is returned
+        # without re-downloading or re-parsing the payload. Kept as a
+        # small LRU so a long-lived container cannot accumulate every
+        # paginated body it has ever seen. Concurrent page fetches share
+        # this client, so every access holds _cond_lock: a lone get +
+        # move_to_end can otherwise race an eviction and KeyError.
+        self._cond_cache: OrderedDict[Tuple[str, Tuple], Tuple[Optional[str], Optional[str], Any, Dict[str, str]]] = OrderedDict()
+        self._cond_lock = threading.Lock()
+
     def _create_session(self) -> requests.Session:
-        """Create a configured requests session."""
+        """Create a configured requests session with a tuned connection pool."""
         session = requests.Session()
         session.headers.update({
             "Accept": "application/json",
             "Content-Type": "application/json",
             "User-Agent": "ATS-Integration-Microservice/1.0"
         })
+        # Size the keep-alive pool for concurrent page fetches; the default
+        # pool holds 10 connections and discards extras, forcing a fresh
+        # TLS handshake on the next request.
+        # max_retries=0: tenacity owns retries (with logging and typed
+        # errors); stacking urllib3 retries on top would multiply attempts.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         return session
     
-    def _get_auth(self) -> Optional[HTTPBasicAuth]:
-        """Get authentication for requests (Greenhouse uses Basic Auth)."""
-        if self.api_key:
-            return HTTPBasicAuth(self.api_key, "")
-        return None
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(RetryableError),
-        reraise=True
-    )
+    def _url_for(self, endpoint: str) -> str:
+        """Build (and memoize) the full URL for an endpoint."""
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = f"{self.base_url}/{endpoint.lstrip('/')}"
+            self._url_cache[endpoint] = url
+        return url
+
     def _make_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        json_data: Optional[Dict[str, Any]] = None
+        json_data: Optional[Dict[str, Any]] = None,
+        return_headers: bool = False
     ) -> Tuple[Dict[str, Any], Dict[str, str]]:
         """
         Make an HTTP request with retry logic.
-        
+
+        Retries use jittered exponential backoff, except rate limits,
+        which wait exactly the server's Retry-After. A 429 that survives
+        the attempt budget surfaces as ATSRateLimitError.
+
         Returns:
-            Tuple of (response_data, response_headers)
+            Tuple of (response_data, response_headers); headers are the
+            shared empty dict unless return_headers is set (only the
+            pagination-facing GET path reads them)
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        
-        logger.info(f"Making {method} request to {url}")
-        
+        try:
+            data, headers = self._retrying(
+                self._request_once, method, endpoint, params, json_data
+            )
+        except RetryableError as e:
+            if e.retry_after is not None:
+                raise ATSRateLimitError(retry_after=e.retry_after)
+            raise
+        return (data, headers) if return_headers else (data, _EMPTY_HEADERS)
+
+    def _request_once(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Make a single HTTP attempt, raising RetryableError when transient."""
+        url = self._url_for(endpoint)
+
+        logger.info("Making %s request to %s", method, url)
+
+        # Send conditional headers when we hold a validated copy
+        cache_key = None
+        cached = None
+        request_headers = None
+        if method == "GET":
+            cache_key = (url, tuple(sorted(params.items())) if params else ())
+            with self._cond_lock:
+                cached = self._cond_cache.get(cache_key)
+                if cached:
+                    self._cond_cache.move_to_end(cache_key)
+            if cached:
+                etag, last_modified = cached[0], cached[1]
+                request_headers = {}
+                if etag:
+                    request_headers["If-None-Match"] = etag
+                if last_modified:
+                    request_headers["If-Modified-Since"] = last_modified
+
         try:
             response = self.session.request(
                 method=method,
                 url=url,
                 params=params,
                 json=json_data,
-                auth=self._get_auth(),
+                headers=request_headers,
                 timeout=self.timeout
             )
-            
-            # Handle rate limiting
+
+            # Unchanged since our last fetch - reuse the parsed body
+            if response.status_code == 304 and cached:
+                logger.info("Not modified, using cached response for %s", url)
+                return cached[2], cached[3]
+
+            # Handle rate limiting: retryable, waiting out the server's
+            # Retry-After before the next attempt
             if response.status_code == 429:
                 retry_after = int(response.headers.get("Retry-After", 60))
-                logger.warning(f"Rate limited. Retry after {retry_after}s")
-                raise ATSRateLimitError(retry_after=retry_after)
+                logger.warning("Rate limited. Retry after %ss", retry_after)
+                raise RetryableError("Rate limited", retry_after=retry_after)
             
             # Handle authentication errors
             if response.status_code == 401:
@@ -113,21 +253,50 @@ class HTTPClient:
             
             # Handle server errors (retryable)
             if response.status_code >= 500:
-                logger.warning(f"Server error {response.status_code}, will retry")
+                logger.warning("Server error %s, will retry", response.status_code)
                 raise RetryableError(f"Server error: {response.status_code}")
             
-            # Raise for other 4xx errors
+            # Raise for other 4xx errors. The truncated body goes to the
+            # logs for debugging; the client-facing message stays synthetic
+            # so vendor error details are never leaked through the API.
             if response.status_code >= 400:
                 error_detail = response.text[:200] if response.text else "Unknown error"
+                logger.warning(
+                    "Request to %s failed with status %s: %s",
+                    url, response.status_code, error_detail
+                )
                 raise ATSError(
                     message=f"Request failed with status {response.status_code}",
                     status_code=response.status_code
                 )
             
-            # Parse successful response
+            # Parse successful response (orjson is several times faster than
+            # stdlib json on the large paginated payloads we see here)
             if response.content:
-                return response.json(), dict(response.headers)
-            return {}, dict(response.headers)
+                data = orjson.loads(response.content)
+            else:
+                data = {}
+            # Hand back the CaseInsensitiveDict itself; callers only read
+            # from it, so the per-request dict copy bought nothing
+            headers = response.headers
+
+            # Remember validators so the next fetch can be conditional,
+            # unless the origin forbids storing the response
+            if cache_key is not None:
+                etag = headers.get("ETag")
+                last_modified = headers.get("Last-Modified")
+                no_store = "no-store" in headers.get("Cache-Control", "")
+                if (etag or last_modified) and not no_store:
+                    with self._cond_lock:
+                        self._cond_cache[cache_key] = (etag, last_modified, data, headers)
+                        self._cond_cache.move_to_end(cache_key)
+                        while len(self._cond_cache) > self._COND_CACHE_MAX:
+                            self._cond_cache.popitem(last=False)
+                elif no_store:
+                    with self._cond_lock:
+                        self._cond_cache.pop(cache_key, None)
+
+            return data, headers
             
         except requests.exceptions.Timeout:
             raise RetryableError("Request timed out")
@@ -142,7 +311,7 @@ class HTTPClient:
         params: Optional[Dict[str, Any]] = None
     ) -> Tuple[Any, Dict[str, str]]:
         """Make a GET request."""
-        return self._make_request("GET", endpoint, params=params)
+        return self._make_request("GET", endpoint, params=params, return_headers=True)
     
     def post(
         self,
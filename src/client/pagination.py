@@ -3,8 +3,9 @@ Pagination handler for ATS APIs.
 Supports multiple pagination styles: link-based, cursor-based, and offset-based.
 """
 import re
-from typing import Any, Callable, Dict, List, Optional, Tuple
-from urllib.parse import parse_qs, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
 
 from ..utils.logging import get_logger
 
@@ -12,23 +13,33 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+# RFC 5988 Link header entry: <url>; rel="next" (also tolerates single/no
+# quotes). Compiled once at import so per-page parsing is a single findall
+# with no intermediate split lists.
+_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel=["\']?(\w+)["\']?')
+
+
 class PaginationHandler:
     """
     Handles pagination for ATS API responses.
     Automatically detects pagination style and fetches all pages.
     """
-    
-    def __init__(self, max_pages: int = 100, page_size: int = 100):
+
+    __slots__ = ("max_pages", "page_size", "max_concurrency")
+
+    def __init__(self, max_pages: int = 100, page_size: int = 100, max_concurrency: int = 8):
         """
         Initialize pagination handler.
-        
+
         Args:
             max_pages: Maximum number of pages to fetch (safety limit)
             page_size: Default page size for requests
+            max_concurrency: Maximum number of pages fetched in parallel
         """
         self.max_pages = max_pages
         self.page_size = page_size
-    
+        self.max_concurrency = max_concurrency
+
     def paginate(
         self,
         fetch_func: Callable[[Dict[str, Any]], Tuple[List[Any], Dict[str, str]]],
@@ -36,112 +47,261 @@ class PaginationHandler:
     ) -> List[Any]:
         """
         Fetch all pages of results from an API endpoint.
-        
+
         Args:
             fetch_func: Function that takes params and returns (items, headers)
             initial_params: Initial query parameters
-            
+
         Returns:
             Combined list of all items across all pages
         """
-        all_items: List[Any] = []
+        return list(self.iter_items(fetch_func, initial_params))
+
+    def iter_items(
+        self,
+        fetch_func: Callable[[Dict[str, Any]], Tuple[List[Any], Dict[str, str]]],
+        initial_params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Any]:
+        """
+        Yield items from all pages as they arrive.
+
+        Fetches page 1, then inspects the Link header: if the API advertises
+        a rel="last" page (Greenhouse Harvest does), the remaining pages are
+        fetched concurrently. Otherwise pages are walked sequentially via
+        rel="next". Streaming items lets callers normalize each record as it
+        arrives instead of holding the full raw list alongside the
+        normalized one.
+
+        Args:
+            fetch_func: Function that takes params and returns (items, headers)
+            initial_params: Initial query parameters
+
+        Yields:
+            Individual items across all pages, in page order
+        """
         params = initial_params.copy() if initial_params else {}
         params.setdefault("per_page", self.page_size)
-        
-        page_count = 0
-        next_url = None
-        
-        while page_count < self.max_pages:
+
+        logger.info("Fetching page 1")
+        items, headers = fetch_func(params)
+        if not isinstance(items, list):
+            items = []
+        total_items = len(items)
+
+        links = self._parse_link_header(headers)
+        last_page = self._page_number(links.get("last"))
+
+        if last_page is None:
+            last_page = self._page_count_from_total(headers, params)
+
+        if last_page and last_page > 1:
+            yield from items
+            # Total page count is known up front: fetch the rest in parallel.
+            base_params = (
+                self._parse_url_params(links["last"]) if "last" in links else dict(params)
+            )
+            for page_items in self._iter_pages_parallel(fetch_func, base_params, last_page):
+                total_items += len(page_items)
+                yield from page_items
+            logger.info("No more pages. Total items: %s", total_items)
+            return
+
+        # Fall back to sequential rel="next" walking when the total page
+        # count is not advertised.
+        next_url = links.get("next")
+        page_count = 1
+
+        if not next_url or page_count >= self.max_pages:
+            yield from items
+            if next_url:
+                logger.warning("Reached max page limit (%s)", self.max_pages)
+            else:
+                logger.info("No more pages. Total items: %s", total_items)
+            return
+
+        # Single-page lookahead: the fetch for page N+1 is submitted before
+        # page N's items are yielded, so the caller's per-item work overlaps
+        # the next round-trip instead of serializing with it.
+        with ThreadPoolExecutor(max_workers=1) as executor:
             page_count += 1
-            logger.info(f"Fetching page {page_count}")
-            
-            # Fetch current page
-            items, headers = fetch_func(params)
-            
-            if isinstance(items, list):
-                all_items.extend(items)
-            
-            # Check for next page
-            next_url = self._get_next_page_url(headers)
-            
-            if not next_url:
-                logger.info(f"No more pages. Total items: {len(all_items)}")
-                break
-            
-            # Update params for next page
-            params = self._parse_url_params(next_url)
-            params.setdefault("per_page", self.page_size)
-        
-        if page_count >= self.max_pages:
-            logger.warning(f"Reached max page limit ({self.max_pages})")
-        
-        return all_items
-    
-    def _get_next_page_url(self, headers: Dict[str, str]) -> Optional[str]:
+            logger.info("Fetching page %s", page_count)
+            future = executor.submit(fetch_func, self._merge_next_page_params(params, next_url))
+            yield from items
+
+            while future is not None:
+                items, headers = future.result()
+                if not isinstance(items, list):
+                    items = []
+                total_items += len(items)
+
+                next_url = self._get_next_page_url(headers)
+                if next_url and page_count < self.max_pages:
+                    page_count += 1
+                    logger.info("Fetching page %s", page_count)
+                    future = executor.submit(fetch_func, self._merge_next_page_params(params, next_url))
+                else:
+                    future = None
+
+                yield from items
+
+        if next_url and page_count >= self.max_pages:
+            logger.warning("Reached max page limit (%s)", self.max_pages)
+        else:
+            logger.info("No more pages. Total items: %s", total_items)
+
+    def _iter_pages_parallel(
+        self,
+        fetch_func: Callable[[Dict[str, Any]], Tuple[List[Any], Dict[str, str]]],
+        base_params: Dict[str, Any],
+        last_page: int
+    ) -> Iterator[List[Any]]:
         """
-        Extract the next page URL from response headers.
-        Supports Link header (RFC 5988) pagination style.
+        Fetch pages 2..last_page concurrently, yielding pages in order.
+
+        Args:
+            fetch_func: Function that takes params and returns (items, headers)
+            base_params: Query parameters shared by every page request
+            last_page: Total number of pages reported by the API
+
+        Yields:
+            Item lists for pages 2..last_page, in page order
         """
+        last_page = min(last_page, self.max_pages)
+        base_params.setdefault("per_page", self.page_size)
+
+        page_params = []
+        for page in range(2, last_page + 1):
+            params = dict(base_params)
+            params["page"] = page
+            page_params.append(params)
+
+        logger.info("Fetching pages 2-%s concurrently", last_page)
+
+        workers = min(self.max_concurrency, len(page_params))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # executor.map preserves submission order, so results stay sorted
+            for items, _ in executor.map(fetch_func, page_params):
+                if isinstance(items, list):
+                    yield items
+
+    def _parse_link_header(self, headers: Dict[str, str]) -> Dict[str, str]:
+        """Parse an RFC 5988 Link header into a rel -> URL mapping."""
         link_header = headers.get("Link", headers.get("link", ""))
-        
+
         if not link_header:
+            return {}
+
+        return {rel: url for url, rel in _LINK_RE.findall(link_header)}
+
+    def _page_number(self, url: Optional[str]) -> Optional[int]:
+        """Extract the 'page' query parameter from a pagination URL."""
+        if not url:
+            return None
+
+        page = self._parse_url_params(url).get("page")
+        try:
+            return int(page) if page is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def _merge_next_page_params(
+        self,
+        params: Dict[str, Any],
+        next_url: str
+    ) -> Dict[str, Any]:
+        """
+        Merge a rel="next" URL's query into the live params dict.
+
+        Most keys are stable between pages, so updating the existing dict
+        in place avoids allocating a fresh one per page; only the changed
+        cursor/page values are overwritten.
+        """
+        params.update(self._parse_url_params(next_url))
+        params.setdefault("per_page", self.page_size)
+        return params
+
+    def _page_count_from_total(
+        self,
+        headers: Dict[str, str],
+        params: Dict[str, Any]
+    ) -> Optional[int]:
+        """
+        Derive the page count from an X-Total-Count header, if present.
+
+        Some ATS APIs advertise the total record count instead of a
+        rel="last" link; dividing by the page size gives the same
+        up-front page count used for parallel fetching.
+        """
+        total = headers.get("X-Total-Count", headers.get("x-total-count"))
+        if not total:
+            return None
+
+        try:
+            total = int(total)
+            per_page = int(params.get("per_page", self.page_size))
+        except (TypeError, ValueError):
             return None
-        
-        # Parse Link header: <url>; rel="next", <url>; rel="last"
-        links = link_header.split(",")
-        
-        for link in links:
-            parts = link.strip().split(";")
-            if len(parts) >= 2:
-                url_part = parts[0].strip()
-                rel_part = parts[1].strip()
-                
-                if 'rel="next"' in rel_part or "rel='next'" in rel_part:
-                    # Extract URL from angle brackets
-                    match = re.match(r'<(.+)>', url_part)
-                    if match:
-                        return match.group(1)
-        
-        return None
+
+        if total <= 0 or per_page <= 0:
+            return None
+
+        return -(-total // per_page)
+
+    def _get_next_page_url(self, headers: Dict[str, str]) -> Optional[str]:
+        """
+        Extract the next page URL from response headers.
+        Supports Link header (RFC 5988) pagination style.
+        """
+        return self._parse_link_header(headers).get("next")
     
     def _parse_url_params(self, url: str) -> Dict[str, Any]:
         """Parse query parameters from a URL."""
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-        
-        # Convert list values to single values
-        return {k: v[0] if len(v) == 1 else v for k, v in params.items()}
+        # parse_qsl yields (key, value) pairs directly, skipping the
+        # per-key list wrapping parse_qs does; pagination URLs never
+        # carry repeated keys
+        return dict(parse_qsl(urlparse(url).query))
 
 
 def paginate_with_offset(
     fetch_func: Callable[[int, int], Tuple[List[Any], int]],
     page_size: int = 100,
-    max_items: int = 10000
+    max_items: int = 10000,
+    max_concurrency: int = 8
 ) -> List[Any]:
     """
     Helper for offset-based pagination.
-    
+
+    The first call returns the total record count, so every remaining
+    offset is known up front and the pages are fetched concurrently
+    instead of one RTT at a time. Results are returned in offset order.
+
     Args:
         fetch_func: Function that takes (offset, limit) and returns (items, total_count)
         page_size: Number of items per page
         max_items: Maximum total items to fetch
-        
+        max_concurrency: Maximum number of pages fetched in parallel
+
     Returns:
         Combined list of all items
     """
-    all_items: List[Any] = []
-    offset = 0
-    
-    while offset < max_items:
-        items, total = fetch_func(offset, page_size)
-        
-        if not items:
-            break
-        
-        all_items.extend(items)
-        offset += len(items)
-        
-        if offset >= total:
-            break
-    
-    return all_items
+    all_items, total = fetch_func(0, page_size)
+    all_items = list(all_items) if all_items else []
+
+    if not all_items:
+        return []
+
+    end = min(total, max_items)
+    offsets = range(len(all_items), end, page_size)
+
+    if not offsets:
+        return all_items
+
+    workers = min(max_concurrency, len(offsets))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # executor.map preserves submission order, keeping items sorted
+        # by offset
+        for items, _ in executor.map(lambda o: fetch_func(o, page_size), offsets):
+            if items:
+                all_items.extend(items)
+
+    return all_items[:max_items]
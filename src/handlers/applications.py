@@ -2,13 +2,17 @@
 GET /applications Lambda handler.
 Returns applications for a specific job.
 """
+import logging
 import time
 from typing import Any, Dict
 
 from ..adapters import get_adapter
+from ..models import APPLICATION_LIST_ADAPTER
 from ..utils import (
+    ATSError,
     ValidationError,
-    format_error_response,
+    format_ats_error_response,
+    format_internal_error_response,
     format_success_response,
     get_logger,
     log_request,
@@ -32,9 +36,10 @@ def get_applications(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         JSON response with list of applications
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     log_request(logger, event)
-    
+    status_code = 200
+
     try:
         # Get query parameters
         query_params = event.get("queryStringParameters") or {}
@@ -53,18 +58,26 @@ def get_applications(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         
         # Build response
         response_data = {
-            "applications": [app.model_dump() for app in applications],
+            "applications": APPLICATION_LIST_ADAPTER.dump_python(applications),
             "job_id": job_id,
             "total_count": len(applications)
         }
-        
-        duration_ms = (time.time() - start_time) * 1000
-        log_response(logger, 200, duration_ms)
-        
+
         return format_success_response(response_data)
-        
+
+    except ATSError as e:
+        logger.error(f"Error fetching applications: {e}", exc_info=True)
+        status_code = e.status_code
+        return format_ats_error_response(e)
+
     except Exception as e:
         logger.error(f"Error fetching applications: {e}", exc_info=True)
-        duration_ms = (time.time() - start_time) * 1000
-        log_response(logger, 500, duration_ms)
-        return format_error_response(e)
+        status_code = 500
+        return format_internal_error_response()
+
+    finally:
+        # Single exit point for timing; skip the arithmetic entirely
+        # when INFO records would be dropped anyway
+        if logger.isEnabledFor(logging.INFO):
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            log_response(logger, status_code, duration_ms)
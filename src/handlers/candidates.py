@@ -2,7 +2,7 @@
 POST /candidates Lambda handler.
 Creates a new candidate and attaches them to a job.
 """
-import json
+import logging
 import time
 from typing import Any, Dict
 
@@ -11,8 +11,10 @@ from pydantic import ValidationError as PydanticValidationError
 from ..adapters import get_adapter
 from ..models import CandidateCreate
 from ..utils import (
+    ATSError,
     ValidationError,
-    format_error_response,
+    format_ats_error_response,
+    format_internal_error_response,
     format_success_response,
     get_logger,
     log_request,
@@ -42,30 +44,32 @@ def create_candidate(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         JSON response with candidate and application IDs
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     log_request(logger, event)
-    
+    status_code = 201
+
     try:
         # Parse request body
         body = event.get("body")
         if not body:
             raise ValidationError("Request body is required")
-        
-        # Handle both string and dict body
-        if isinstance(body, str):
-            try:
-                body_data = json.loads(body)
-            except json.JSONDecodeError:
-                raise ValidationError("Invalid JSON in request body")
-        else:
-            body_data = body
-        
-        # Validate request data
+
+        # Validate request data. String bodies go through
+        # model_validate_json so pydantic-core parses and validates in
+        # one pass instead of json.loads plus a field-by-field __init__.
         try:
-            candidate_data = CandidateCreate(**body_data)
+            if isinstance(body, str):
+                candidate_data = CandidateCreate.model_validate_json(body)
+            else:
+                candidate_data = CandidateCreate.model_validate(body)
         except PydanticValidationError as e:
             errors = e.errors()
-            details = {err["loc"][0]: err["msg"] for err in errors}
+            if len(errors) == 1 and errors[0]["type"] == "json_invalid":
+                raise ValidationError("Invalid JSON in request body")
+            details = {
+                (err["loc"][0] if err["loc"] else "body"): err["msg"]
+                for err in errors
+            }
             raise ValidationError("Validation failed", details=details)
         
         # Get adapter and create candidate
@@ -74,14 +78,22 @@ def create_candidate(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         
         # Build response
         response_data = result.model_dump()
-        
-        duration_ms = (time.time() - start_time) * 1000
-        log_response(logger, 201, duration_ms)
-        
+
         return format_success_response(response_data, status_code=201)
-        
+
+    except ATSError as e:
+        logger.error(f"Error creating candidate: {e}", exc_info=True)
+        status_code = e.status_code
+        return format_ats_error_response(e)
+
     except Exception as e:
         logger.error(f"Error creating candidate: {e}", exc_info=True)
-        duration_ms = (time.time() - start_time) * 1000
-        log_response(logger, 500, duration_ms)
-        return format_error_response(e)
+        status_code = 500
+        return format_internal_error_response()
+
+    finally:
+        # Single exit point for timing; skip the arithmetic entirely
+        # when INFO records would be dropped anyway
+        if logger.isEnabledFor(logging.INFO):
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            log_response(logger, status_code, duration_ms)
@@ -2,12 +2,16 @@
 GET /jobs Lambda handler.
 Returns a list of open jobs from the configured ATS.
 """
+import logging
 import time
 from typing import Any, Dict
 
 from ..adapters import get_adapter
+from ..models import JOB_LIST_ADAPTER
 from ..utils import (
-    format_error_response,
+    ATSError,
+    format_ats_error_response,
+    format_internal_error_response,
     format_success_response,
     get_logger,
     log_request,
@@ -31,31 +35,40 @@ def get_jobs(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         JSON response with list of jobs
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     log_request(logger, event)
-    
+    status_code = 200
+
     try:
         # Get query parameters
         query_params = event.get("queryStringParameters") or {}
         status_filter = query_params.get("status")
-        
+
         # Get adapter and fetch jobs
         adapter = get_adapter()
         jobs = adapter.get_jobs(status_filter=status_filter)
-        
+
         # Build response
         response_data = {
-            "jobs": [job.model_dump() for job in jobs],
+            "jobs": JOB_LIST_ADAPTER.dump_python(jobs),
             "total_count": len(jobs)
         }
-        
-        duration_ms = (time.time() - start_time) * 1000
-        log_response(logger, 200, duration_ms)
-        
+
         return format_success_response(response_data)
-        
+
+    except ATSError as e:
+        logger.error(f"Error fetching jobs: {e}", exc_info=True)
+        status_code = e.status_code
+        return format_ats_error_response(e)
+
     except Exception as e:
         logger.error(f"Error fetching jobs: {e}", exc_info=True)
-        duration_ms = (time.time() - start_time) * 1000
-        log_response(logger, 500, duration_ms)
-        return format_error_response(e)
+        status_code = 500
+        return format_internal_error_response()
+
+    finally:
+        # Single exit point for timing; skip the arithmetic entirely
+        # when INFO records would be dropped anyway
+        if logger.isEnabledFor(logging.INFO):
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            log_response(logger, status_code, duration_ms)
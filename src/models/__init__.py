@@ -1,13 +1,24 @@
 # Models Package
-from .job import Job, JobList
+from pydantic import TypeAdapter
+
+from .job import Job, JobList, JobStatus
 from .candidate import CandidateCreate, CandidateResponse
-from .application import Application, ApplicationList
+from .application import Application, ApplicationList, ApplicationStatus
+
+# List adapters for bulk dumping in handlers: one compiled pass over the
+# whole list instead of a per-instance model_dump call
+JOB_LIST_ADAPTER = TypeAdapter(list[Job])
+APPLICATION_LIST_ADAPTER = TypeAdapter(list[Application])
 
 __all__ = [
     "Job",
     "JobList",
+    "JobStatus",
+    "ApplicationStatus",
     "CandidateCreate",
     "CandidateResponse",
     "Application",
     "ApplicationList",
+    "JOB_LIST_ADAPTER",
+    "APPLICATION_LIST_ADAPTER",
 ]
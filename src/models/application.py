@@ -1,19 +1,27 @@
 """
 Application model representing a job application.
 """
-from typing import Literal, Optional
+from enum import Enum
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
+class ApplicationStatus(str, Enum):
+    """Unified application status values."""
+
+    APPLIED = "APPLIED"
+    SCREENING = "SCREENING"
+    REJECTED = "REJECTED"
+    HIRED = "HIRED"
+
+
 class Application(BaseModel):
     """Unified application model normalized across all ATS providers."""
-    
+
     id: str = Field(..., description="Unique application identifier")
     candidate_name: str = Field(..., description="Name of the candidate")
     email: str = Field(..., description="Candidate email address")
-    status: Literal["APPLIED", "SCREENING", "REJECTED", "HIRED"] = Field(
-        ..., description="Application status"
-    )
+    status: ApplicationStatus = Field(..., description="Application status")
     
     class Config:
         json_schema_extra = {
@@ -1,17 +1,26 @@
 """
 Job model representing a unified job posting.
 """
-from typing import Literal, Optional
+from enum import Enum
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
+class JobStatus(str, Enum):
+    """Unified job status values."""
+
+    OPEN = "OPEN"
+    CLOSED = "CLOSED"
+    DRAFT = "DRAFT"
+
+
 class Job(BaseModel):
     """Unified job model normalized across all ATS providers."""
-    
+
     id: str = Field(..., description="Unique job identifier")
     title: str = Field(..., description="Job title")
     location: str = Field(..., description="Job location")
-    status: Literal["OPEN", "CLOSED", "DRAFT"] = Field(..., description="Job status")
+    status: JobStatus = Field(..., description="Job status")
     external_url: str = Field(..., description="Public-facing job URL")
     
     class Config:
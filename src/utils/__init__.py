@@ -7,7 +7,9 @@ from .errors import (
     ATSAuthenticationError,
     ATSRateLimitError,
     ATSNotFoundError,
+    format_ats_error_response,
     format_error_response,
+    format_internal_error_response,
     format_success_response,
 )
 from .logging import get_logger, log_request, log_response
@@ -21,7 +23,9 @@ __all__ = [
     "ATSAuthenticationError",
     "ATSRateLimitError",
     "ATSNotFoundError",
+    "format_ats_error_response",
     "format_error_response",
+    "format_internal_error_response",
     "format_success_response",
     "get_logger",
     "log_request",
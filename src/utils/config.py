@@ -5,16 +5,19 @@ Loads environment variables securely with validation.
 import os
 from functools import lru_cache
 from typing import Optional
-from dotenv import load_dotenv
-
-# Load environment variables from .env file for local development
-load_dotenv(override=True)
 
 
 class Config:
     """Application configuration loaded from environment variables."""
-    
+
     def __init__(self):
+        # Load .env for local development lazily so importing this module
+        # (which every handler does transitively) skips the dotenv import
+        # and filesystem probe on Lambda; the lru_cache on get_config
+        # means this runs once per container.
+        from dotenv import load_dotenv
+        load_dotenv(override=True)
+
         self._ats_provider: str = os.getenv("ATS_PROVIDER", "greenhouse").lower()
         self._ats_api_key: Optional[str] = os.getenv("ATS_API_KEY")
         
@@ -4,11 +4,25 @@ Provides custom exceptions and error response formatting.
 """
 from typing import Any, Dict, Optional
 from enum import Enum
-import json
 
+import orjson
 
-class ErrorCode(Enum):
-    """Standardized error codes."""
+
+def _dumps(obj: Any) -> str:
+    """Serialize a response body with orjson, stringifying unknown types.
+
+    The no-default fast path covers every visible handler payload
+    (plain dicts/lists/strings); the default=str retry only runs for
+    exotic values such as datetimes.
+    """
+    try:
+        return orjson.dumps(obj).decode()
+    except TypeError:
+        return orjson.dumps(obj, default=str).decode()
+
+
+class ErrorCode(str, Enum):
+    """Standardized error codes (str-backed, so they serialize directly)."""
     VALIDATION_ERROR = "VALIDATION_ERROR"
     ATS_CONNECTION_ERROR = "ATS_CONNECTION_ERROR"
     ATS_AUTHENTICATION_ERROR = "ATS_AUTHENTICATION_ERROR"
@@ -18,9 +32,30 @@ class ErrorCode(Enum):
     INTERNAL_ERROR = "INTERNAL_ERROR"
 
 
+# ErrorCode -> (status_code, retryable), fixed per error class and looked
+# up once per construction instead of spelled out in each subclass
+_ERROR_DEFAULTS = {
+    ErrorCode.VALIDATION_ERROR: (400, False),
+    ErrorCode.ATS_CONNECTION_ERROR: (503, True),
+    ErrorCode.ATS_AUTHENTICATION_ERROR: (401, False),
+    ErrorCode.ATS_RATE_LIMIT_ERROR: (429, True),
+    ErrorCode.ATS_NOT_FOUND: (404, False),
+    ErrorCode.ATS_SERVICE_ERROR: (500, False),
+    ErrorCode.INTERNAL_ERROR: (500, False),
+}
+
+
 class ATSError(Exception):
     """Base exception for ATS-related errors."""
-    
+
+    # Slot descriptors for the fixed field set. BaseException still
+    # carries an instance __dict__, so the win is faster attribute
+    # access rather than dropping the dict entirely.
+    __slots__ = (
+        "message", "error_code", "retryable", "status_code",
+        "original_error", "_cached_dict"
+    )
+
     def __init__(
         self,
         message: str,
@@ -35,109 +70,178 @@ class ATSError(Exception):
         self.retryable = retryable
         self.status_code = status_code
         self.original_error = original_error
-    
+        self._cached_dict: Optional[Dict[str, Any]] = None
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert error to API response format."""
-        return {
-            "error": self.error_code.value,
-            "message": self.message,
-            "retryable": self.retryable
-        }
+        """
+        Convert error to API response format.
+
+        The dict is built once and reused: errors are typically rendered
+        twice (structured log plus response body) and the fields never
+        change after __init__.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "error": self.error_code,
+                "message": self.message,
+                "retryable": self.retryable
+            }
+        return self._cached_dict
 
 
 class ValidationError(ATSError):
     """Raised when request validation fails."""
-    
+
+    __slots__ = ("details",)
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            message=message,
-            error_code=ErrorCode.VALIDATION_ERROR,
-            retryable=False,
-            status_code=400
-        )
+        status_code, retryable = _ERROR_DEFAULTS[ErrorCode.VALIDATION_ERROR]
+        ATSError.__init__(self, message, ErrorCode.VALIDATION_ERROR, retryable, status_code)
         self.details = details or {}
-    
+
     def to_dict(self) -> Dict[str, Any]:
-        result = super().to_dict()
-        if self.details:
-            result["details"] = self.details
-        return result
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "error": self.error_code,
+                "message": self.message,
+                "retryable": self.retryable
+            }
+            if self.details:
+                self._cached_dict["details"] = self.details
+        return self._cached_dict
 
 
 class ATSConnectionError(ATSError):
     """Raised when connection to ATS fails."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str = "Unable to connect to ATS service"):
-        super().__init__(
-            message=message,
-            error_code=ErrorCode.ATS_CONNECTION_ERROR,
-            retryable=True,
-            status_code=503
-        )
+        status_code, retryable = _ERROR_DEFAULTS[ErrorCode.ATS_CONNECTION_ERROR]
+        ATSError.__init__(self, message, ErrorCode.ATS_CONNECTION_ERROR, retryable, status_code)
 
 
 class ATSAuthenticationError(ATSError):
     """Raised when ATS authentication fails."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str = "ATS authentication failed"):
-        super().__init__(
-            message=message,
-            error_code=ErrorCode.ATS_AUTHENTICATION_ERROR,
-            retryable=False,
-            status_code=401
-        )
+        status_code, retryable = _ERROR_DEFAULTS[ErrorCode.ATS_AUTHENTICATION_ERROR]
+        ATSError.__init__(self, message, ErrorCode.ATS_AUTHENTICATION_ERROR, retryable, status_code)
 
 
 class ATSRateLimitError(ATSError):
     """Raised when ATS rate limit is exceeded."""
-    
+
+    __slots__ = ("retry_after",)
+
     def __init__(self, message: str = "ATS rate limit exceeded", retry_after: Optional[int] = None):
-        super().__init__(
-            message=message,
-            error_code=ErrorCode.ATS_RATE_LIMIT_ERROR,
-            retryable=True,
-            status_code=429
-        )
+        status_code, retryable = _ERROR_DEFAULTS[ErrorCode.ATS_RATE_LIMIT_ERROR]
+        ATSError.__init__(self, message, ErrorCode.ATS_RATE_LIMIT_ERROR, retryable, status_code)
         self.retry_after = retry_after
 
 
 class ATSNotFoundError(ATSError):
     """Raised when requested resource is not found in ATS."""
-    
+
+    __slots__ = ()
+
     def __init__(self, resource_type: str, resource_id: str):
-        super().__init__(
-            message=f"{resource_type} with ID '{resource_id}' not found",
-            error_code=ErrorCode.ATS_NOT_FOUND,
-            retryable=False,
-            status_code=404
+        status_code, retryable = _ERROR_DEFAULTS[ErrorCode.ATS_NOT_FOUND]
+        ATSError.__init__(
+            self,
+            f"{resource_type} with ID '{resource_id}' not found",
+            ErrorCode.ATS_NOT_FOUND,
+            retryable,
+            status_code
         )
 
 
-def format_error_response(error: Exception, status_code: int = 500) -> Dict[str, Any]:
-    """Format any exception into a standardized API error response."""
-    if isinstance(error, ATSError):
-        return {
-            "statusCode": error.status_code,
-            "headers": {"Content-Type": "application/json"},
-            "body": json.dumps(error.to_dict())
-        }
-    
-    # Generic error - hide internal details
+# Static response pieces, built once at import: the headers dict is shared
+# (callers never mutate it) and the generic internal-error response never
+# varies, so one response dict serves every unexpected failure
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GENERIC_INTERNAL_BODY = _dumps({
+    "error": ErrorCode.INTERNAL_ERROR,
+    "message": "An unexpected error occurred",
+    "retryable": False
+})
+_INTERNAL_ERROR_RESPONSE = {
+    "statusCode": 500,
+    "headers": _JSON_HEADERS,
+    "body": _GENERIC_INTERNAL_BODY
+}
+
+# Per-code body templates, serialized once at import. Only the message
+# varies between two errors of the same code, so the runtime cost of the
+# common path is one orjson string encode plus a bytes substitution.
+_BODY_TEMPLATES: Dict[ErrorCode, bytes] = {
+    code: (
+        f'{{"error":"{code.value}","message":%s,'
+        f'"retryable":{"true" if retryable else "false"}}}'
+    ).encode()
+    for code, (_status, retryable) in _ERROR_DEFAULTS.items()
+}
+
+
+def format_ats_error_response(error: ATSError) -> Dict[str, Any]:
+    """Format a known ATSError into a standardized API error response."""
+    # Templates bake in each code's default retryable flag; errors with
+    # extra fields (ValidationError details) or an overridden flag take
+    # the full-serialization path instead.
+    details = getattr(error, "details", None)
+    if details or error.retryable is not _ERROR_DEFAULTS[error.error_code][1]:
+        body = _dumps(error.to_dict())
+    else:
+        body = (_BODY_TEMPLATES[error.error_code] % orjson.dumps(error.message)).decode()
+
     return {
-        "statusCode": status_code,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps({
-            "error": ErrorCode.INTERNAL_ERROR.value,
-            "message": "An unexpected error occurred",
-            "retryable": False
-        })
+        "statusCode": error.status_code,
+        "headers": _JSON_HEADERS,
+        "body": body
     }
 
 
+def format_internal_error_response() -> Dict[str, Any]:
+    """Generic 500 response for unexpected errors - hides internal details.
+
+    Returns the prebuilt module-level response; handlers return it to the
+    Lambda runtime without mutation, so no per-call copy is needed.
+    """
+    return _INTERNAL_ERROR_RESPONSE
+
+
+def format_error_response(error: Exception, status_code: int = 500) -> Dict[str, Any]:
+    """Format any exception into a standardized API error response.
+
+    Compatibility shim: callers that know the exception type should use
+    format_ats_error_response or format_internal_error_response directly
+    and skip the isinstance dispatch here.
+    """
+    if isinstance(error, ATSError):
+        return format_ats_error_response(error)
+    return format_internal_error_response()
+
+
 def format_success_response(data: Any, status_code: int = 200) -> Dict[str, Any]:
-    """Format successful response."""
+    """
+    Format successful response.
+
+    Pre-serialized JSON bodies (str or bytes) pass through untouched so
+    callers that already hold serialized output are not re-encoded;
+    bytes are decoded exactly once because the Lambda proxy contract
+    requires body to be a str.
+    """
+    if isinstance(data, bytes):
+        body = data.decode()
+    elif isinstance(data, str):
+        body = data
+    else:
+        body = _dumps(data)
+
     return {
         "statusCode": status_code,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps(data, default=str)
+        "headers": _JSON_HEADERS,
+        "body": body
     }
@@ -2,58 +2,140 @@
 Logging utility module.
 Provides structured logging for Lambda functions.
 """
+import atexit
+import io
 import logging
-import json
 import sys
+import time
 from typing import Any, Dict, Optional
 from functools import lru_cache
 
+import orjson
+
 from .config import get_config
 
 
+@lru_cache(maxsize=4)
+def _iso_second(sec: int) -> str:
+    """Format a whole second as UTC ISO8601, cached per second.
+
+    Records emitted within the same second share the strftime/gmtime
+    cost; only the millisecond suffix varies per record.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+
+
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
-    
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """UTC ISO8601 timestamp with millisecond precision."""
+        return f"{_iso_second(int(record.created))}.{int(record.msecs):03d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
+        timestamp = self.formatTime(record)
+
+        # Fast path for the common record with no extras or exception:
+        # build the line directly, escaping only the free-form message.
+        # Level and logger names come from code and never need escaping.
+        if not (record.exc_info or hasattr(record, "extra_data")):
+            message = orjson.dumps(record.getMessage()).decode()
+            return (
+                f'{{"timestamp":"{timestamp}","level":"{record.levelname}",'
+                f'"logger":"{record.name}","message":{message}}}'
+            )
+
         log_data = {
-            "timestamp": self.formatTime(record),
+            "timestamp": timestamp,
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
-        
+
         # Add extra fields if present
         if hasattr(record, "extra_data"):
             log_data["data"] = record.extra_data
-        
+
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
-        
-        return json.dumps(log_data, default=str)
+
+        # orjson keeps per-line formatting cheap on log-heavy invocations
+        return orjson.dumps(log_data, default=str).decode()
+
+
+# One handler/formatter pair shared by every logger: handler count stays
+# O(1) regardless of module count, and all writes funnel through a single
+# lock on stdout
+def _log_stream():
+    """
+    Build the stream log records are written to.
+
+    Writes go through a dedicated line-buffered UTF-8 wrapper over
+    stdout's byte buffer, so each record is handed to the OS in one
+    write instead of whatever chunking the ambient sys.stdout applies.
+    Falls back to sys.stdout when no byte buffer is exposed (e.g. under
+    test runners that substitute a plain text stream).
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        return sys.stdout
+
+    stream = io.TextIOWrapper(buffer, encoding="utf-8", line_buffering=True)
+
+    def _flush():
+        try:
+            stream.flush()
+        except ValueError:
+            # Stream already closed during interpreter shutdown
+            pass
+
+    atexit.register(_flush)
+    return stream
+
+
+_SHARED_HANDLER = logging.StreamHandler(_log_stream())
+_SHARED_HANDLER.setFormatter(JSONFormatter())
+
+# Numeric level resolved once, on first logger creation rather than at
+# import - touching get_config() here would pull the config (and its
+# dotenv probe) into the import path of every handler. LOG_LEVEL cannot
+# change within a container's lifetime.
+_LEVEL: Optional[int] = None
+
+
+# name -> configured logger; a plain dict lookup beats lru_cache's
+# hashing and lock machinery for the handful of module loggers here
+_LOGGERS: Dict[str, logging.Logger] = {}
 
 
-@lru_cache(maxsize=10)
 def get_logger(name: str) -> logging.Logger:
     """Get a configured logger instance."""
-    config = get_config()
-    
+    global _LEVEL
+
+    logger = _LOGGERS.get(name)
+    if logger is not None:
+        return logger
+
+    if _LEVEL is None:
+        _LEVEL = getattr(logging, get_config().log_level, logging.INFO)
+
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, config.log_level, logging.INFO))
-    
-    # Clear existing handlers
-    logger.handlers.clear()
-    
-    # Add JSON handler for production
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(JSONFormatter())
-    logger.addHandler(handler)
-    
+    logger.setLevel(_LEVEL)
+
+    if _SHARED_HANDLER not in logger.handlers:
+        logger.addHandler(_SHARED_HANDLER)
+
+    _LOGGERS[name] = logger
     return logger
 
 
 def log_request(logger: logging.Logger, event: Dict[str, Any]) -> None:
     """Log incoming request details."""
+    # Skip the extra_data dict build when INFO is filtered out
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     logger.info(
         "Incoming request",
         extra={
@@ -68,6 +150,9 @@ def log_request(logger: logging.Logger, event: Dict[str, Any]) -> None:
 
 def log_response(logger: logging.Logger, status_code: int, duration_ms: Optional[float] = None) -> None:
     """Log outgoing response details."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     data: Dict[str, Any] = {"status_code": status_code}
     if duration_ms is not None:
         data["duration_ms"] = round(duration_ms, 2)
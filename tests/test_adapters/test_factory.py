@@ -0,0 +1,49 @@
+"""
+Unit tests for the adapter factory.
+"""
+import pytest
+from unittest.mock import Mock, patch
+
+from src.adapters.factory import get_adapter, list_adapters
+
+
+class TestAdapterFactory:
+    """Tests for adapter factory caching and lookup."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Keep cached adapter instances from leaking between tests."""
+        get_adapter.cache_clear()
+        yield
+        get_adapter.cache_clear()
+
+    def test_get_adapter_returns_cached_instance(self):
+        """Test repeated calls reuse one adapter per provider."""
+        with patch("src.adapters.factory.get_config") as mock_factory_config, \
+             patch("src.adapters.greenhouse.get_config") as mock_gh_config:
+            mock_factory_config.return_value = Mock(ats_provider="greenhouse")
+            mock_gh_config.return_value = Mock(
+                ats_api_key="test_key",
+                ats_base_url="https://harvest.greenhouse.io/v1"
+            )
+
+            first = get_adapter()
+            second = get_adapter()
+
+            assert first is second
+
+    def test_get_adapter_unknown_provider(self):
+        """Test unsupported providers raise ValueError."""
+        with patch("src.adapters.factory.get_config") as mock_config:
+            mock_config.return_value = Mock(ats_provider="unknown_ats")
+
+            with pytest.raises(ValueError, match="Unsupported ATS provider"):
+                get_adapter()
+
+    def test_list_adapters(self):
+        """Test the built-in providers are registered."""
+        adapters = list_adapters()
+
+        assert "greenhouse" in adapters
+        assert "zoho_recruit" in adapters
+        assert "workable" in adapters
@@ -8,19 +8,34 @@ from src.adapters.greenhouse import GreenhouseAdapter
 from src.models import Job, CandidateCreate, CandidateResponse, Application
 
 
+@pytest.fixture(scope="module", autouse=True)
+def mock_config():
+    """Patch get_config once for the whole module."""
+    with patch("src.adapters.greenhouse.get_config") as config:
+        config.return_value = Mock(
+            ats_api_key="test_key",
+            ats_base_url="https://harvest.greenhouse.io/v1"
+        )
+        yield config
+
+
+@pytest.fixture(scope="module")
+def adapter():
+    """Create one adapter shared across tests (no state is mutated)."""
+    return GreenhouseAdapter()
+
+
+@pytest.fixture
+def adapter_with_mock_client():
+    """Create a fresh adapter with a mocked HTTP client per test."""
+    adapter = GreenhouseAdapter()
+    adapter.client = Mock()
+    return adapter
+
+
 class TestGreenhouseAdapter:
     """Tests for GreenhouseAdapter class."""
-    
-    @pytest.fixture
-    def adapter(self):
-        """Create adapter with mocked config."""
-        with patch("src.adapters.greenhouse.get_config") as mock_config:
-            mock_config.return_value = Mock(
-                ats_api_key="test_key",
-                ats_base_url="https://harvest.greenhouse.io/v1"
-            )
-            return GreenhouseAdapter()
-    
+
     @pytest.fixture
     def sample_greenhouse_job(self):
         """Sample Greenhouse job data."""
@@ -58,18 +73,16 @@ class TestGreenhouseAdapter:
         assert job.location == "San Francisco, CA"
         assert "123456" in job.external_url
     
-    def test_normalize_job_status_mapping(self, adapter):
-        """Test all job status mappings."""
-        test_cases = [
-            ({"id": 1, "name": "Test", "status": "open"}, "OPEN"),
-            ({"id": 2, "name": "Test", "status": "closed"}, "CLOSED"),
-            ({"id": 3, "name": "Test", "status": "draft"}, "DRAFT"),
-            ({"id": 4, "name": "Test", "status": "unknown"}, "DRAFT"),
-        ]
-        
-        for raw_job, expected_status in test_cases:
-            job = adapter._normalize_job(raw_job)
-            assert job.status == expected_status
+    @pytest.mark.parametrize("status_in,status_out", [
+        ("open", "OPEN"),
+        ("closed", "CLOSED"),
+        ("draft", "DRAFT"),
+        ("unknown", "DRAFT"),
+    ])
+    def test_normalize_job_status_mapping(self, adapter, status_in, status_out):
+        """Test job status mapping."""
+        job = adapter._normalize_job({"id": 1, "name": "Test", "status": status_in})
+        assert job.status == status_out
     
     def test_extract_location_from_offices(self, adapter):
         """Test location extraction from offices."""
@@ -134,34 +147,28 @@ class TestGreenhouseAdapter:
         app = adapter._normalize_application(raw_app)
         assert app.status == "HIRED"
     
-    def test_extract_first_name(self, adapter):
+    @pytest.mark.parametrize("full_name,first_name", [
+        ("John Doe", "John"),
+        ("Jane", "Jane"),
+        ("Mary Jane Watson", "Mary"),
+    ])
+    def test_extract_first_name(self, adapter, full_name, first_name):
         """Test first name extraction."""
-        assert adapter._extract_first_name("John Doe") == "John"
-        assert adapter._extract_first_name("Jane") == "Jane"
-        assert adapter._extract_first_name("Mary Jane Watson") == "Mary"
-    
-    def test_extract_last_name(self, adapter):
+        assert adapter._extract_first_name(full_name) == first_name
+
+    @pytest.mark.parametrize("full_name,last_name", [
+        ("John Doe", "Doe"),
+        ("Jane", ""),
+        ("Mary Jane Watson", "Jane Watson"),
+    ])
+    def test_extract_last_name(self, adapter, full_name, last_name):
         """Test last name extraction."""
-        assert adapter._extract_last_name("John Doe") == "Doe"
-        assert adapter._extract_last_name("Jane") == ""
-        assert adapter._extract_last_name("Mary Jane Watson") == "Jane Watson"
+        assert adapter._extract_last_name(full_name) == last_name
 
 
 class TestGreenhouseAdapterIntegration:
     """Integration tests that mock HTTP client."""
-    
-    @pytest.fixture
-    def adapter_with_mock_client(self):
-        """Create adapter with mocked HTTP client."""
-        with patch("src.adapters.greenhouse.get_config") as mock_config:
-            mock_config.return_value = Mock(
-                ats_api_key="test_key",
-                ats_base_url="https://harvest.greenhouse.io/v1"
-            )
-            adapter = GreenhouseAdapter()
-            adapter.client = Mock()
-            return adapter
-    
+
     def test_get_jobs_success(self, adapter_with_mock_client):
         """Test successful job fetching."""
         adapter = adapter_with_mock_client
@@ -206,8 +213,38 @@ class TestGreenhouseAdapterIntegration:
         )
         
         result = adapter.create_candidate(candidate_data)
-        
+
         assert result.candidate_id == "789"
         assert result.application_id == "456"
         assert result.name == "John Doe"
         assert result.status == "APPLIED"
+
+    def test_create_candidates_bulk(self, adapter_with_mock_client):
+        """Test concurrent bulk candidate creation preserves input order."""
+        adapter = adapter_with_mock_client
+
+        adapter.client.post.return_value = (
+            {
+                "id": 789,
+                "applications": [{"id": 456}]
+            },
+            {}
+        )
+
+        candidates = [
+            CandidateCreate(name=f"Candidate {i}", email=f"c{i}@example.com", job_id="123")
+            for i in range(5)
+        ]
+
+        results = adapter.create_candidates(candidates)
+
+        assert len(results) == 5
+        assert [r.name for r in results] == [c.name for c in candidates]
+        assert adapter.client.post.call_count == 5
+
+    def test_create_candidates_empty(self, adapter_with_mock_client):
+        """Test bulk creation with no candidates makes no requests."""
+        adapter = adapter_with_mock_client
+
+        assert adapter.create_candidates([]) == []
+        adapter.client.post.assert_not_called()
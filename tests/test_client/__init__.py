@@ -0,0 +1 @@
+# Test Client Package
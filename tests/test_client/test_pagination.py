@@ -0,0 +1,123 @@
+"""
+Unit tests for the pagination handler.
+"""
+import pytest
+
+from src.client.pagination import PaginationHandler, paginate_with_offset
+
+
+class TestPaginationHandler:
+    """Tests for PaginationHandler class."""
+
+    @pytest.fixture
+    def paginator(self):
+        """Create a pagination handler with small page size."""
+        return PaginationHandler(page_size=2)
+
+    def test_single_page(self, paginator):
+        """Test pagination with a single page and no Link header."""
+        def fetch_page(params):
+            return [1, 2], {}
+
+        items = paginator.paginate(fetch_page)
+        assert items == [1, 2]
+
+    def test_sequential_next_links(self, paginator):
+        """Test sequential pagination following rel="next" links."""
+        pages = {
+            1: ([1, 2], {"Link": '<https://api.example.com/items?page=2>; rel="next"'}),
+            2: ([3, 4], {"Link": '<https://api.example.com/items?page=3>; rel="next"'}),
+            3: ([5], {}),
+        }
+
+        def fetch_page(params):
+            return pages[int(params.get("page", 1))]
+
+        items = paginator.paginate(fetch_page)
+        assert items == [1, 2, 3, 4, 5]
+
+    def test_parallel_fetch_with_last_link(self, paginator):
+        """Test concurrent fetching when rel="last" is advertised."""
+        pages = {
+            1: [1, 2],
+            2: [3, 4],
+            3: [5, 6],
+            4: [7],
+        }
+        first_headers = {
+            "Link": (
+                '<https://api.example.com/items?page=2>; rel="next", '
+                '<https://api.example.com/items?page=4>; rel="last"'
+            )
+        }
+
+        def fetch_page(params):
+            page = int(params.get("page", 1))
+            return pages[page], first_headers if page == 1 else {}
+
+        items = paginator.paginate(fetch_page)
+        assert items == [1, 2, 3, 4, 5, 6, 7]
+
+    def test_parallel_fetch_with_total_count(self, paginator):
+        """Test concurrent fetching driven by an X-Total-Count header."""
+        pages = {
+            1: [1, 2],
+            2: [3, 4],
+            3: [5],
+        }
+
+        def fetch_page(params):
+            page = int(params.get("page", 1))
+            return pages[page], {"X-Total-Count": "5"} if page == 1 else {}
+
+        items = paginator.paginate(fetch_page, {"per_page": 2})
+        assert items == [1, 2, 3, 4, 5]
+
+    def test_parse_link_header(self, paginator):
+        """Test Link header parsing into rel -> URL mapping."""
+        headers = {
+            "Link": (
+                '<https://api.example.com/items?page=2>; rel="next", '
+                '<https://api.example.com/items?page=9>; rel="last"'
+            )
+        }
+        links = paginator._parse_link_header(headers)
+
+        assert links["next"] == "https://api.example.com/items?page=2"
+        assert links["last"] == "https://api.example.com/items?page=9"
+
+    def test_parse_link_header_missing(self, paginator):
+        """Test Link header parsing when no header is present."""
+        assert paginator._parse_link_header({}) == {}
+
+    def test_page_number_extraction(self, paginator):
+        """Test page number extraction from pagination URLs."""
+        assert paginator._page_number("https://api.example.com/items?page=7") == 7
+        assert paginator._page_number("https://api.example.com/items") is None
+        assert paginator._page_number(None) is None
+
+
+class TestPaginateWithOffset:
+    """Tests for the offset-based pagination helper."""
+
+    def test_fetches_all_offsets_in_order(self):
+        """Test parallel offset fetching preserves offset order."""
+        data = list(range(7))
+
+        def fetch(offset, limit):
+            return data[offset:offset + limit], len(data)
+
+        assert paginate_with_offset(fetch, page_size=2) == data
+
+    def test_empty_first_page(self):
+        """Test empty result when the first page has no items."""
+        assert paginate_with_offset(lambda o, l: ([], 0), page_size=2) == []
+
+    def test_respects_max_items(self):
+        """Test the max_items cap is honored."""
+        data = list(range(10))
+
+        def fetch(offset, limit):
+            return data[offset:offset + limit], len(data)
+
+        assert paginate_with_offset(fetch, page_size=2, max_items=5) == data[:5]